@@ -5,7 +5,7 @@ This module supports two deployment modes:
 
 1) Home Assistant Add-on
    - Reads /data/options.json (validated by config.yaml schema)
-   - Mirrors keys into environment variables
+   - Feeds the parsed options directly into Settings (highest priority source)
 
 2) Standalone / Docker / venv
    - Reads a .env file (see .env.example)
@@ -21,34 +21,49 @@ import json
 import os
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    InitSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
 OPTIONS_PATH = "/data/options.json"
 
-def _load_ha_options_into_env() -> None:
-    """If running as a HA add-on, load options.json into env vars."""
+def _load_ha_options() -> dict:
+    """If running as a HA add-on, parse options.json once into a settings dict.
+
+    The parsed values are fed straight into Settings (see settings_customise_sources)
+    instead of being stringified into env vars and re-parsed by pydantic.
+    """
     if not os.path.exists(OPTIONS_PATH):
-        return
+        return {}
 
     try:
         with open(OPTIONS_PATH, "r", encoding="utf-8") as f:
             options = json.load(f)
 
+        values = {}
         for key, value in options.items():
-            env_key = key.upper()
             if isinstance(value, (list, dict)):
-                os.environ[env_key] = json.dumps(value)
+                values[key] = value
             elif value is not None and str(value).strip():
-                os.environ[env_key] = str(value)
-            elif key == "mqtt_host":
+                # Scalars keep the old env-var semantics: pydantic gets a string and
+                # coerces it per field (so e.g. bridge_id: 42 still becomes "42").
+                values[key] = str(value)
+            elif key == "mqtt_host" and "MQTT_HOST" not in os.environ:
                 # Allow users to leave mqtt_host blank in the add-on UI and still connect.
-                os.environ.setdefault("MQTT_HOST", "core-mosquitto")
+                values[key] = "core-mosquitto"
 
         print("[CONFIG] Success! Loaded settings from Home Assistant.")
+        return values
     except Exception as e:  # pragma: no cover
-        print(f"[CONFIG] Error loading options: {e}")
+        # run.sh no longer mirrors array options into env vars, so there is no
+        # fallback: say loudly that every add-on option (incl. rtl_config) is ignored.
+        print(f"[CONFIG] ERROR: Could not load {OPTIONS_PATH} ({e}). Add-on options are IGNORED; using defaults.")
+        return {}
 
-_load_ha_options_into_env()
+_HA_OPTIONS = _load_ha_options()
 
 class Settings(BaseSettings):
     """Main application settings."""
@@ -59,6 +74,19 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        # HA add-on options take precedence over env vars and .env (as before).
+        ha_options = InitSettingsSource(settings_cls, init_kwargs=_HA_OPTIONS)
+        return (init_settings, ha_options, env_settings, dotenv_settings, file_secret_settings)
+
     # --- MQTT ---
     mqtt_host: str = Field(default="localhost")
     mqtt_port: int = Field(default=1883)
@@ -248,10 +276,11 @@ RTL_AUTO_HOPPER_FREQS = settings.rtl_auto_hopper_freqs
 RTL_AUTO_HOPPER_HOP_INTERVAL = settings.rtl_auto_hopper_hop_interval
 RTL_AUTO_HOPPER_RATE = settings.rtl_auto_hopper_rate
 
-SKIP_KEYS = settings.skip_keys
+# Membership-only lookups on the per-reading hot path: export as frozensets.
+SKIP_KEYS = frozenset(settings.skip_keys)
 DEVICE_BLACKLIST = settings.device_blacklist
 DEVICE_WHITELIST = settings.device_whitelist
-MAIN_SENSORS = settings.main_sensors
+MAIN_SENSORS = frozenset(settings.main_sensors)
 
 RTL_EXPIRE_AFTER = settings.rtl_expire_after
 FORCE_NEW_IDS = settings.force_new_ids
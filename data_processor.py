@@ -4,12 +4,15 @@ FILE: data_processor.py
 DESCRIPTION:
   Handles data buffering, throttling, and averaging to reduce MQTT traffic.
   - dispatch_reading(): Adds data to buffer or sends immediately if throttling is 0.
-  - start_throttle_loop(): Runs in a background thread to flush averages.
+  - start_throttle_loop(): Runs in a background thread to flush averages (until stop()).
   - UPDATED: Now accepts and logs 'radio_freq'.
+  - UPDATED: Buffer is a flat dict keyed by (clean_id, field); per-interval device metadata lives in self.meta.
+  - UPDATED: Averages are accumulated online (running sum/count) instead of storing every sample.
 """
 import threading
 import time
-import statistics
+from operator import itemgetter
+
 import config
 
 
@@ -19,11 +22,48 @@ NON_AVERAGED_NUMERIC_FIELDS = {
     "battery_ok",
 }
 
+_meta_fields = itemgetter("name", "model", "radio", "freq")
+
+class _Accumulator:
+    """Running sum/count for one (device, field) during a throttle interval.
+
+    O(1) memory no matter how chatty the device is.
+    """
+
+    __slots__ = ("total", "count", "last", "numeric")
+
+    def __init__(self, value, numeric):
+        self.total = value if numeric else 0.0
+        self.count = 1
+        self.last = value
+        self.numeric = numeric
+
+    def add(self, value, numeric):
+        if self.numeric and numeric:
+            self.total += value
+        else:
+            # Once a non-numeric sample shows up, fall back to "last value wins".
+            self.numeric = False
+        self.count += 1
+        self.last = value
+
+
 class DataProcessor:
     def __init__(self, mqtt_handler):
         self.mqtt_handler = mqtt_handler
+        # Flat buffer keyed by (clean_id, field) -> accumulator, plus per-device
+        # metadata (name/model/radio/freq) kept separately so flushing never has to
+        # skip over a sentinel entry. Both are swapped out together on every flush.
         self.buffer = {}
+        self.meta = {}
         self.lock = threading.Lock()
+        self._stop = threading.Event()
+
+        # dispatch_reading() runs once per decoded field, so resolve config and the
+        # publish callable once here instead of on every reading. The throttle loop
+        # uses the same interval so both sides always agree on whether to buffer.
+        self.interval = getattr(config, "RTL_THROTTLE_INTERVAL", 0)
+        self._send_sensor = mqtt_handler.send_sensor
 
     # --- FIX 1: Add radio_freq to arguments ---
     def dispatch_reading(self, clean_id, field, value, dev_name, model, radio_name="Unknown", radio_freq="Unknown"):
@@ -32,104 +72,124 @@ class DataProcessor:
         If throttling is disabled (interval <= 0), sends immediately.
         Otherwise, stores it in the buffer.
         """
-        interval = getattr(config, "RTL_THROTTLE_INTERVAL", 0)
-
         # Skip null readings; they shouldn't influence averages or "last known" decisions.
         if value is None:
             return
         
         # 1. Immediate Dispatch (No Throttling)
-        if interval <= 0:
-            self.mqtt_handler.send_sensor(clean_id, field, value, dev_name, model, is_rtl=True)
+        if self.interval <= 0:
+            self._send_sensor(clean_id, field, value, dev_name, model, is_rtl=True)
             return
 
         # 2. Buffered Dispatch
         with self.lock:
-            if clean_id not in self.buffer:
-                self.buffer[clean_id] = {}
-            
             # Store metadata so we know who this device is when flushing
-            if "__meta__" not in self.buffer[clean_id]:
-                self.buffer[clean_id]["__meta__"] = {
-                    "name": dev_name, 
-                    "model": model, 
+            meta = self.meta.get(clean_id)
+            if meta is None:
+                self.meta[clean_id] = {
+                    "name": dev_name,
+                    "model": model,
                     "radio": radio_name,
-                    "freq": radio_freq  # --- FIX 2: Store the frequency ---
+                    "freq": radio_freq,
                 }
             else:
-                self.buffer[clean_id]["__meta__"]["radio"] = radio_name
-                self.buffer[clean_id]["__meta__"]["freq"] = radio_freq
-            
-            if field not in self.buffer[clean_id]:
-                self.buffer[clean_id][field] = []
-            
-            self.buffer[clean_id][field].append(value)
+                meta["radio"] = radio_name
+                meta["freq"] = radio_freq
+
+            key = (clean_id, field)
+            # bool is an int subclass, but True/False flags must not be averaged.
+            numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+            acc = self.buffer.get(key)
+            if acc is None:
+                self.buffer[key] = _Accumulator(value, numeric)
+            else:
+                acc.add(value, numeric)
+
+    def flush_once(self):
+        """Flush one buffered batch.
+
+        Returns:
+          (count_sent, stats_by_radio)
+        """
+        # 1. Swap buffers safely
+        with self.lock:
+            if not self.buffer:
+                return 0, {}
+            # Swap references instead of copying: O(1) under the lock.
+            # Meta is swapped with the readings so the batch is a consistent
+            # snapshot and devices that go quiet (e.g. rolling TPMS IDs) are dropped.
+            current_batch, self.buffer = self.buffer, {}
+            current_meta, self.meta = self.meta, {}
+
+        count_sent = 0
+        stats_by_radio = {}
+
+        # Bind once per flush; the loops below run per buffered field.
+        non_averaged = NON_AVERAGED_NUMERIC_FIELDS
+        send_bulk = self.mqtt_handler.send_sensor_bulk
+
+        # 2. Compute final values, grouped per device
+        by_device = {}
+        for (clean_id, field), acc in current_batch.items():
+            # Calculate Average (or last known value for strings)
+            if acc.numeric and field not in non_averaged:
+                final_val = round(acc.total / acc.count, 2)
+                if final_val.is_integer():
+                    final_val = int(final_val)
+            else:
+                # Strings, mixed types and NON_AVERAGED fields (e.g. battery_ok):
+                # publish the last valid sample, not the mean.
+                final_val = acc.last
+
+            fields = by_device.get(clean_id)
+            if fields is None:
+                by_device[clean_id] = {field: final_val}
+            else:
+                fields[field] = final_val
+
+        # 3. One publish call per device
+        for clean_id, fields in by_device.items():
+            # dispatch_reading() always records meta (all four keys) in the same
+            # locked step as the reading, so every device in the batch has one.
+            dev_name, model, r_name, r_freq = _meta_fields(current_meta[clean_id])
+
+            send_bulk(clean_id, fields, dev_name, model, is_rtl=True)
+            count_sent += len(fields)
+
+            # --- FIX 3: Group by Radio + Frequency for the log ---
+            key = f"{r_name}"
+            if r_freq and r_freq != "Unknown":
+                key = f"{r_name}[{r_freq}]"
+
+            stats_by_radio[key] = stats_by_radio.get(key, 0) + len(fields)
+
+        # --- Consolidated Heartbeat Log ---
+        if count_sent > 0:
+            # Format: (RTL_101[915M]: 5, RTL_001[433.92M]: 3)
+            details = ", ".join([f"{k}: {v}" for k, v in stats_by_radio.items()])
+            print(f"[THROTTLE] Flushed {count_sent} readings ({details})")
+
+        return count_sent, stats_by_radio
+
+    def stop(self):
+        """Ask start_throttle_loop() to exit at its next wakeup (returns immediately)."""
+        self._stop.set()
 
     def start_throttle_loop(self):
         """
         Thread loop that wakes up every RTL_THROTTLE_INTERVAL seconds,
         averages the buffered data, and sends it to MQTT.
+        Returns once stop() is called (main() does this on shutdown).
         """
-        interval = getattr(config, "RTL_THROTTLE_INTERVAL", 30)
+        interval = self.interval
         if interval <= 0:
             return
 
         print(f"[THROTTLE] Averaging data every {interval} seconds.")
-        
-        while True:
-            time.sleep(interval)
-            
-            # 1. Swap buffers safely
-            with self.lock:
-                if not self.buffer:
-                    continue
-                current_batch = self.buffer.copy()
-                self.buffer.clear()
-
-            count_sent = 0
-            stats_by_radio = {}
-            
-            # 2. Process batch
-            for clean_id, device_data in current_batch.items():
-                meta = device_data.get("__meta__", {})
-                dev_name = meta.get("name", "Unknown")
-                model = meta.get("model", "Unknown")
-                r_name = meta.get("radio", "Unknown")
-                r_freq = meta.get("freq", "")
-
-                for field, values in device_data.items():
-                    if field == "__meta__": 
-                        continue
-                    if not values: 
-                        continue
-
-                    # Calculate Average (or last known value for strings)
-                    final_val = None
-                    try:
-                        if field in NON_AVERAGED_NUMERIC_FIELDS:
-                            # E.g. battery_ok: publish the last valid sample, not the mean.
-                            final_val = values[-1]
-                        elif isinstance(values[0], (int, float)):
-                            final_val = round(statistics.mean(values), 2)
-                            if final_val.is_integer():
-                                final_val = int(final_val)
-                        else:
-                            final_val = values[-1]
-                    except:
-                        final_val = values[-1]
-
-                    self.mqtt_handler.send_sensor(clean_id, field, final_val, dev_name, model, is_rtl=True)
-                    count_sent += 1
-                    
-                    # --- FIX 3: Group by Radio + Frequency for the log ---
-                    key = f"{r_name}"
-                    if r_freq and r_freq != "Unknown":
-                        key = f"{r_name}[{r_freq}]"
-                        
-                    stats_by_radio[key] = stats_by_radio.get(key, 0) + 1
-            
-            # --- Consolidated Heartbeat Log ---
-            if count_sent > 0:
-                # Format: (RTL_101[915M]: 5, RTL_001[433.92M]: 3)
-                details = ", ".join([f"{k}: {v}" for k, v in stats_by_radio.items()])
-                print(f"[THROTTLE] Flushed {count_sent} readings ({details})")
\ No newline at end of file
+
+        # Event.wait() doubles as an interruptible sleep. The deadline is taken
+        # before flushing so time spent publishing doesn't stretch the cadence.
+        deadline = time.monotonic() + interval
+        while not self._stop.wait(max(0.0, deadline - time.monotonic())):
+            deadline = time.monotonic() + interval
+            self.flush_once()
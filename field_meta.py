@@ -182,6 +182,12 @@ MODEL_FIELD_META = {
     },
 }
 
+# Normalized once at import: (lowercase prefix, mapping), longest prefix first so the
+# most specific model override wins.
+_MODEL_PREFIXES = tuple(
+    sorted(((p.strip().lower(), m) for p, m in MODEL_FIELD_META.items()), key=lambda pm: -len(pm[0]))
+)
+
 def get_field_meta(field: str, device_model: str | None = None, base_meta: dict | None = None):
     """Return (unit, device_class, icon, friendly_name) for a field, optionally model-aware.
 
@@ -191,7 +197,7 @@ def get_field_meta(field: str, device_model: str | None = None, base_meta: dict
     """
     if device_model:
         model_norm = str(device_model).strip().lower()
-        for prefix, mapping in MODEL_FIELD_META.items():
+        for prefix, mapping in _MODEL_PREFIXES:
             if model_norm.startswith(prefix):
                 meta = mapping.get(field)
                 if meta is not None:
@@ -15,11 +15,11 @@ os.environ["TERM"] = "xterm-256color"
 os.environ["CLICOLOR_FORCE"] = "1"
 
 import builtins
-from datetime import datetime
 import threading
 import time
 import importlib.util
-import subprocess
+import shutil
+import signal
 
 # --- 1. GLOBAL LOGGING & COLOR SETUP ---
 c_cyan    = "\033[1;36m"   # Bold Cyan (Radio IDs / JSON Keys)
@@ -34,7 +34,11 @@ c_reset   = "\033[0m"
 
 _original_print = builtins.print
 
-def get_source_color(clean_text):
+# Source tags are a small, stable set (MQTT, STARTUP, radio ids, ...): memoize their color.
+_SOURCE_COLOR_CACHE = {}
+_SOURCE_COLOR_CACHE_MAX = 256
+
+def _classify_source_color(clean_text):
     clean = clean_text.lower()
     if "unsupported" in clean: return c_yellow
     if "supported" in clean: return c_green
@@ -44,54 +48,83 @@ def get_source_color(clean_text):
     if "nuke" in clean: return c_red
     return c_cyan
 
+def get_source_color(clean_text):
+    color = _SOURCE_COLOR_CACHE.get(clean_text)
+    if color is None:
+        color = _classify_source_color(clean_text)
+        if len(_SOURCE_COLOR_CACHE) < _SOURCE_COLOR_CACHE_MAX:
+            _SOURCE_COLOR_CACHE[clean_text] = color
+    return color
+
+# Compiled once: these run on every printed line.
+# One alternation so highlight_json() walks the line once; group order matches the
+# old key -> string -> number -> literal passes.
+_RE_JSON_TOKEN = re.compile(
+    r'(?P<key>"[^"]+")\s*:'
+    r'|:\s*(?P<sval>"[^"]+")'
+    r'|:\s*(?P<num>-?\d+\.?\d*)'
+    r'|:\s*(?P<lit>true|false|null)'
+)
+_RE_UNSUPPORTED_VARIANT = re.compile(r"\[\s*!!\s*UNSUPPORTED\s*!!\s*\]")
+_RE_SUPPORTED_VARIANT = re.compile(r"\[\s*SUPPORTED\s*\]")
+_RE_TX_SRC = re.compile(r".*?\[(.*?)(?:\])?:\s+(.*)")
+
+_UNSUPPORTED_TAG = f"{c_white}[{c_reset}{c_yellow}UNSUPPORTED{c_reset}{c_white}]{c_reset}"
+_SUPPORTED_TAG = f"{c_white}[{c_reset}{c_green}SUPPORTED{c_reset}{c_white}]{c_reset}"
+
+def _json_token_repl(m):
+    kind = m.lastgroup
+    if kind == "key":
+        return f'{c_cyan}{m.group("key")}{c_reset}{c_white}:{c_reset}'
+    return f': {c_white}{m.group(kind)}{c_reset}'
+
 def highlight_json(text):
-    text = re.sub(r'("[^"]+")\s*:', f'{c_cyan}\\1{c_reset}{c_white}:{c_reset}', text)
-    text = re.sub(r':\s*("[^"]+")', f': {c_white}\\1{c_reset}', text)
-    text = re.sub(r':\s*(-?\d+\.?\d*)', f': {c_white}\\1{c_reset}', text)
-    text = re.sub(r':\s*(true|false|null)', f': {c_white}\\1{c_reset}', text)
-    return text
+    return _RE_JSON_TOKEN.sub(_json_token_repl, text)
 
 def highlight_support_tags(text: str) -> str:
     # Normalize common variants (so old logs still color nicely)
-    text = re.sub(r"\[\s*!!\s*UNSUPPORTED\s*!!\s*\]", "[UNSUPPORTED]", text)
-    text = re.sub(r"\[\s*SUPPORTED\s*\]", "[SUPPORTED]", text)
+    text = _RE_UNSUPPORTED_VARIANT.sub("[UNSUPPORTED]", text)
+    text = _RE_SUPPORTED_VARIANT.sub("[SUPPORTED]", text)
 
     # Colorize tags anywhere in the line
-    text = re.sub(
-        r"\[UNSUPPORTED\]",
-        f"{c_white}[{c_reset}{c_yellow}UNSUPPORTED{c_reset}{c_white}]{c_reset}",
-        text,
-    )
-    text = re.sub(
-        r"\[SUPPORTED\]",
-        f"{c_white}[{c_reset}{c_green}SUPPORTED{c_reset}{c_white}]{c_reset}",
-        text,
-    )
+    text = text.replace("[UNSUPPORTED]", _UNSUPPORTED_TAG)
+    text = text.replace("[SUPPORTED]", _SUPPORTED_TAG)
     return text
 
+# Level headers never change at runtime; build them once.
+_H_INFO  = f"{c_green}INFO{c_reset}{c_white}:{c_reset}"
+_H_ERROR = f"{c_red}ERROR{c_reset}{c_white}:{c_reset}"
+_H_WARN  = f"{c_yellow}WARN{c_reset}{c_white}:{c_reset}"
+_H_DEBUG = f"{c_magenta}DEBUG{c_reset}{c_white}:{c_reset}"
+_H_DATA  = f"{c_green}DATA{c_reset}{c_white}:{c_reset}"
+
 def timestamped_print(*args, **kwargs):
-    now = datetime.now().strftime("%H:%M:%S")
+    now = time.strftime("%H:%M:%S")
     time_prefix = f"{c_dim}[{now}]{c_reset}"
-    msg = " ".join(map(str, args))
+    # Nearly every call is print("[TAG] ...") with a single str: skip the join.
+    if len(args) == 1 and type(args[0]) is str:
+        msg = args[0]
+    else:
+        msg = " ".join(map(str, args))
     lower_msg = msg.lower()
     
-    header = f"{c_green}INFO{c_reset}{c_white}:{c_reset}" 
+    header = _H_INFO
     special_formatting_applied = False
     
     if any(x in lower_msg for x in ["error", "critical", "failed", "crashed"]):
-        header = f"{c_red}ERROR{c_reset}{c_white}:{c_reset}"
+        header = _H_ERROR
         msg = msg.replace("CRITICAL:", "").replace("ERROR:", "").strip()
     elif "warning" in lower_msg:
-        header = f"{c_yellow}WARN{c_reset}{c_white}:{c_reset}"
+        header = _H_WARN
         msg = msg.replace("WARNING:", "").strip()
     elif "debug" in lower_msg:
-        header = f"{c_magenta}DEBUG{c_reset}{c_white}:{c_reset}"
+        header = _H_DEBUG
         msg = msg.replace("[DEBUG]", "").replace("[debug]", "").strip()
         if "{" in msg and "}" in msg: msg = highlight_json(msg)
     elif "-> tx" in lower_msg:
-        header = f"{c_green}DATA{c_reset}{c_white}:{c_reset}"
+        header = _H_DATA
         msg = msg.replace("-> TX", "").strip()
-        match = re.match(r".*?\[(.*?)(?:\])?:\s+(.*)", msg)
+        match = _RE_TX_SRC.match(msg)
         if match:
             src_text = match.group(1).replace("]", "")
             val = match.group(2)
@@ -99,11 +132,16 @@ def timestamped_print(*args, **kwargs):
             special_formatting_applied = True
 
     if not special_formatting_applied:
-        match = re.match(r"^\[(.*?)\]\s*(.*)", msg)
-        if match:
-            src_text = match.group(1)
-            rest_of_msg = match.group(2)
-            rest_of_msg = re.sub(r"^(RX:?|:)\s*", "", rest_of_msg).strip()
+        # "[src] rest" — plain string ops; this runs for nearly every line.
+        end = msg.find("]") if msg.startswith("[") else -1
+        if end != -1:
+            src_text = msg[1:end]
+            rest_of_msg = msg[end + 1:].lstrip()
+            for prefix in ("RX:", "RX", ":"):
+                if rest_of_msg.startswith(prefix):
+                    rest_of_msg = rest_of_msg[len(prefix):]
+                    break
+            rest_of_msg = rest_of_msg.strip()
             s_color = get_source_color(src_text)
             msg = f"{c_white}[{c_reset}{s_color}{src_text}{c_reset}{c_white}]:{c_reset} {rest_of_msg}"
 
@@ -113,7 +151,7 @@ def timestamped_print(*args, **kwargs):
 builtins.print = timestamped_print
 
 def check_dependencies():
-    if not subprocess.run(["which", "rtl_433"], capture_output=True).stdout:
+    if shutil.which("rtl_433") is None:
         print("CRITICAL: 'rtl_433' binary not found. Please install it.")
         sys.exit(1)
     if importlib.util.find_spec("paho") is None:
@@ -163,18 +201,29 @@ def get_version():
     return "Unknown"
 
 
+_LOGO_LINES = (
+    r"   ____  _____  _         _   _    _    ___  ____  ",
+    r"  |  _ \|_   _|| |       | | | |  / \  / _ \/ ___| ",
+    r"  | |_) | | |  | |  ___  | |_| | / _ \| | | \___ \ ",
+    r"  |  _ <  | |  | | |___| |  _  |/ ___ \ |_| |___) |",
+    r"  |_| \_\ |_|  |_____|   |_| |_/_/   \_\___/|____/ ",
+)
+_LOGO_BLOCK = "".join(f"{c_blue}{line}{c_reset}\n" for line in _LOGO_LINES)
+
 def show_logo(version):
-    logo_lines = [
-        r"   ____  _____  _         _   _    _    ___  ____  ",
-        r"  |  _ \|_   _|| |       | | | |  / \  / _ \/ ___| ",
-        r"  | |_) | | |  | |  ___  | |_| | / _ \| | | \___ \ ",
-        r"  |  _ <  | |  | | |___| |  _  |/ ___ \ |_| |___) |",
-        r"  |_| \_\ |_|  |_____|   |_| |_/_/   \_\___/|____/ "
-    ]
-    for line in logo_lines: sys.stdout.write(f"{c_blue}{line}{c_reset}\n")
-    sys.stdout.write(f"\n{c_cyan}>>> RTL-SDR Bridge for Home Assistant ({c_reset}{c_yellow}{version}{c_reset}{c_cyan}) <<<{c_reset}\n\n\n")
+    # One write so the banner can't interleave with early thread output.
+    sys.stdout.write(
+        f"{_LOGO_BLOCK}\n{c_cyan}>>> RTL-SDR Bridge for Home Assistant ({c_reset}{c_yellow}{version}{c_reset}{c_cyan}) <<<{c_reset}\n\n\n"
+    )
     sys.stdout.flush()
 
+# Set on SIGTERM (add-on stop / docker stop); main() idles on it instead of polling.
+_SHUTDOWN = threading.Event()
+
+def _wait_for_shutdown():
+    """Block the main thread until shutdown is requested. Ctrl+C still raises KeyboardInterrupt."""
+    _SHUTDOWN.wait()
+
 def main():
     check_dependencies()
     ver = get_version()
@@ -227,17 +276,14 @@ def main():
         for d in detected_devices:
             sid = str(d.get('id', ''))
             serial_counts[sid] = serial_counts.get(sid, 0) + 1
-            if 'id' in d and 'index' in d: pass 
 
         for sid, count in serial_counts.items():
             if count > 1:
                 print(f"[STARTUP] WARNING: [Hardware] Multiple SDRs detected with same Serial '{sid}'. IDs must be unique for precise mapping. Use rtl_eeprom to fix.")
 
-    serial_to_index = {}
+    # Serials were already normalized (str + strip) by the duplicate-rename pass above.
+    serial_to_index = {d['id']: d['index'] for d in detected_devices if 'index' in d}
     if detected_devices:
-        for d in detected_devices:
-            if 'id' in d and 'index' in d:
-                serial_to_index[str(d['id'])] = d['index']
         print(f"[STARTUP] Hardware Map: {serial_to_index}")
     else:
         # --- NEW WARNING: No Hardware Found ---
@@ -271,8 +317,8 @@ def main():
             if target_id:
                 seen_config_ids.add(target_id)
             
-            if target_id and target_id in serial_to_index:
-                idx = serial_to_index[target_id]
+            idx = serial_to_index.get(target_id) if target_id else None
+            if idx is not None:
                 radio['index'] = idx
                 configured_ids.add(target_id)
                 print(f"[STARTUP] Matched Config '{r_name}' (Serial {target_id}) to Physical Index {idx}")
@@ -603,10 +649,13 @@ def main():
     threading.Thread(target=system_stats_loop, args=(mqtt_handler, sys_id, sys_model), daemon=True).start()
 
     try:
-        while True: time.sleep(1)
+        _wait_for_shutdown()
     except KeyboardInterrupt:
-        print("\n[SHUTDOWN] Stopping MQTT...")
-        mqtt_handler.stop()
+        pass
+    print("\n[SHUTDOWN] Stopping MQTT...")
+    processor.stop()
+    mqtt_handler.stop()
 
 if __name__ == "__main__":
+    signal.signal(signal.SIGTERM, lambda *_: _SHUTDOWN.set())
     main()
\ No newline at end of file
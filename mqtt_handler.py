@@ -554,13 +554,32 @@ class HomeNodeMQTT:
         if value is None:
             return
 
+        clean_id = self._track_device(sensor_id, device_name, device_model)
+        self._send_field(clean_id, field, value, device_name, device_model, is_rtl, friendly_name)
+
+    def send_sensor_bulk(self, sensor_id, fields, device_name, device_model, is_rtl=True):
+        """Publish several fields of one device (e.g. a throttle flush) in one call.
+
+        Device bookkeeping (ID cleaning, tracking, model cache) runs once per device
+        instead of once per field; each field then goes through the normal path.
+        """
+        clean_id = self._track_device(sensor_id, device_name, device_model)
+        for field, value in fields.items():
+            if value is None:
+                continue
+            self._send_field(clean_id, field, value, device_name, device_model, is_rtl, None)
+
+    def _track_device(self, sensor_id, device_name, device_model):
+        """Record a device as seen and return its clean_id."""
         self.tracked_devices.add(device_name)
 
-        clean_id = clean_mac(sensor_id) 
-        
+        clean_id = clean_mac(sensor_id)
+
         # Remember model for model-specific discovery/unit overrides.
         self._device_model_by_id[clean_id] = str(device_model)
+        return clean_id
 
+    def _send_field(self, clean_id, field, value, device_name, device_model, is_rtl, friendly_name):
         unique_id_base = clean_id
         state_topic_base = clean_id
 
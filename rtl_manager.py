@@ -8,12 +8,14 @@ import json
 import time
 import fnmatch
 import copy
+import re
 import sys
 import os
 import shlex
 from pathlib import Path
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 import config
@@ -646,16 +648,26 @@ def _debug_dump_packet(
     print("[JSONDUMP] END\n")
 
 
+@lru_cache(maxsize=8)
+def _compile_globs(patterns: tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """Compile a tuple of glob patterns into one alternation regex (None if empty).
+
+    Keyed on the pattern tuple so a changed config (or a test patch) recompiles.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(str(p))})" for p in patterns))
+
+
+def _glob_regex(patterns) -> Optional["re.Pattern[str]"]:
+    return _compile_globs(tuple(patterns or ()))
+
+
 def is_blocked_device(clean_id: str, model: str, dev_type: str) -> bool:
-    patterns = getattr(config, "DEVICE_BLACKLIST", [])
-    for pattern in patterns:
-        if fnmatch.fnmatch(str(clean_id), pattern):
-            return True
-        if fnmatch.fnmatch(str(model), pattern):
-            return True
-        if fnmatch.fnmatch(str(dev_type), pattern):
-            return True
-    return False
+    rx = _glob_regex(getattr(config, "DEVICE_BLACKLIST", []))
+    if rx is None:
+        return False
+    return bool(rx.match(str(clean_id)) or rx.match(str(model)) or rx.match(str(dev_type)))
 
 
 def discover_rtl_devices():
@@ -826,8 +838,8 @@ def rtl_loop(radio_config: dict, mqtt_handler, data_processor, sys_id: str, sys_
                     if is_blocked_device(clean_id, model, dev_type):
                         continue
 
-                    whitelist = getattr(config, "DEVICE_WHITELIST", [])
-                    if whitelist and not any(fnmatch.fnmatch(clean_id, p) for p in whitelist):
+                    whitelist_rx = _glob_regex(getattr(config, "DEVICE_WHITELIST", []))
+                    if whitelist_rx is not None and not whitelist_rx.match(clean_id):
                         continue
 
                     # Neptune R900 Water Meter
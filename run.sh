@@ -42,18 +42,9 @@ if [ -f /data/options.json ]; then
         export DEBUG_RAW_JSON=$(bashio::config 'debug_raw_json')
     fi
 
-    # Handle array configs
-    # For arrays, use jq to read directly from /data/options.json to ensure proper JSON format
-    CONFIG_PATH="/data/options.json"
-
-    export RTL_CONFIG=$(jq -c '.rtl_config // []' "$CONFIG_PATH")
-    bashio::log.debug "RTL_CONFIG=${RTL_CONFIG}"
-
-    export DEVICE_BLACKLIST=$(jq -c '.device_blacklist // ["SimpliSafe*","EezTire*"]' "$CONFIG_PATH")
-    bashio::log.debug "DEVICE_BLACKLIST=${DEVICE_BLACKLIST}"
-
-    export DEVICE_WHITELIST=$(jq -c '.device_whitelist // []' "$CONFIG_PATH")
-    bashio::log.debug "DEVICE_WHITELIST=${DEVICE_WHITELIST}"
+    # Array options (rtl_config, device_blacklist, device_whitelist) are read by
+    # config.py straight from /data/options.json as parsed JSON, so there is no need
+    # to re-serialize them into env vars here.
 
     # Use MQTT service if available and no host configured
     # Check if MQTT_HOST was exported (i.e., user provided a non-empty value)
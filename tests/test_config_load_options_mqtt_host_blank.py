@@ -7,15 +7,44 @@ import config
 
 
 def test_load_options_sets_default_mqtt_host_when_blank(tmp_path, monkeypatch):
-    opts = {"mqtt_host": ""}  # blank should set MQTT_HOST default
+    opts = {"mqtt_host": ""}  # blank should fall back to the HA broker
     p = tmp_path / "options.json"
     p.write_text(json.dumps(opts), encoding="utf-8")
 
     monkeypatch.setattr(config, "OPTIONS_PATH", str(p), raising=False)
     # Ensure env is clean
-    os.environ.pop("MQTT_HOST", None)
+    monkeypatch.delenv("MQTT_HOST", raising=False)
 
     # Call loader directly (covers branch without requiring module re-import)
-    config._load_ha_options_into_env()
+    options = config._load_ha_options()
 
-    assert os.environ.get("MQTT_HOST") == "core-mosquitto"
+    assert options["mqtt_host"] == "core-mosquitto"
+
+
+def test_load_options_blank_mqtt_host_defers_to_env(tmp_path, monkeypatch):
+    p = tmp_path / "options.json"
+    p.write_text(json.dumps({"mqtt_host": "", "rtl_config": [{"id": "101"}]}), encoding="utf-8")
+
+    monkeypatch.setattr(config, "OPTIONS_PATH", str(p), raising=False)
+    monkeypatch.setenv("MQTT_HOST", "broker.local")
+
+    options = config._load_ha_options()
+
+    # Env (e.g. exported by run.sh from the MQTT service) wins over the blank option.
+    assert "mqtt_host" not in options
+    # Composite values are kept as parsed objects (no JSON round-trip through env).
+    assert options["rtl_config"] == [{"id": "101"}]
+
+
+def test_load_options_numeric_value_for_str_option(tmp_path, monkeypatch):
+    p = tmp_path / "options.json"
+    p.write_text(json.dumps({"bridge_id": 42, "mqtt_port": 1884, "force_new_ids": True}), encoding="utf-8")
+
+    monkeypatch.setattr(config, "OPTIONS_PATH", str(p), raising=False)
+    monkeypatch.setattr(config, "_HA_OPTIONS", config._load_ha_options(), raising=False)
+
+    settings = config.Settings()
+
+    assert settings.bridge_id == "42"
+    assert settings.mqtt_port == 1884
+    assert settings.force_new_ids is True
@@ -7,13 +7,13 @@ import runpy
 
 
 def test_config_options_blank_mqtt_host_defaults_to_core_mosquitto(monkeypatch):
-    """Covers config._load_ha_options_into_env list/dict handling and mqtt_host blank default."""
+    """Covers config._load_ha_options list/dict handling and mqtt_host blank default."""
 
     options = {
         "mqtt_host": "",  # intentionally blank in HA UI
         "mqtt_port": 1883,
 
-        # list/dict types should be json.dumps'd into env vars
+        # list/dict types are passed to Settings as parsed objects
         "device_blacklist": ["Bad*", "Nope*"],
         "rtl_config": [
             {"name": "RTL_0", "id": "000", "freq": "433.92M"},
@@ -45,5 +45,7 @@ def test_config_options_blank_mqtt_host_defaults_to_core_mosquitto(monkeypatch):
 
     assert ns["MQTT_SETTINGS"]["host"] == "core-mosquitto"
     assert ns["DEVICE_BLACKLIST"] == ["Bad*", "Nope*"]
+    assert isinstance(ns["SKIP_KEYS"], frozenset) and "time" in ns["SKIP_KEYS"]
+    assert isinstance(ns["MAIN_SENSORS"], frozenset)
     assert isinstance(ns["RTL_CONFIG"], list)
     assert ns["RTL_CONFIG"][0]["freq"] == "433.92M"
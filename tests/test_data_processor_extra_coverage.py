@@ -9,6 +9,11 @@ class DummyMQTT:
         self.calls = []
 
     # matches usage in data_processor.py
+    def send_sensor_bulk(self, clean_id, fields, dev_name, model, is_rtl=True):
+        # Throttled flushes publish all fields of a device in one call.
+        for field, value in fields.items():
+            self.send_sensor(clean_id, field, value, dev_name, model, is_rtl=is_rtl)
+
     def send_sensor(self, clean_id, field, value, dev_name, model, is_rtl=False):
         self.calls.append(
             {
@@ -76,13 +81,15 @@ def test_dispatch_reading_buffers_and_updates_meta(monkeypatch):
         radio_freq="433M",
     )
 
-    assert "devA" in dp.buffer
-    meta = dp.buffer["devA"]["__meta__"]
+    assert "devA" in dp.meta
+    meta = dp.meta["devA"]
     assert meta["name"] == "DeviceA"
     assert meta["model"] == "M1"
     assert meta["radio"] == "RTL_A2"
     assert meta["freq"] == "433M"
-    assert dp.buffer["devA"]["humidity"] == [50, 60]
+    # Running sum/count accumulator
+    acc = dp.buffer[("devA", "humidity")]
+    assert (acc.total, acc.count, acc.last, acc.numeric) == (110, 2, 60, True)
 
 
 def test_start_throttle_loop_flushes_all_branches(monkeypatch, capsys):
@@ -93,35 +100,19 @@ def test_start_throttle_loop_flushes_all_branches(monkeypatch, capsys):
 
     # Preload the buffer so the loop has work on its first iteration.
     # NOTE: use floats to reliably hit final_val.is_integer() path on Python 3.13
-    with dp.lock:
-        dp.buffer = {
-            "dev_float_int": {
-                "__meta__": {"name": "DevF", "model": "M", "radio": "RTL_F", "freq": "915M"},
-                "temp": [1.0, 1.0],  # mean -> 1.0 -> is_integer -> int(1)
-            },
-            "dev_string": {
-                "__meta__": {"name": "DevS", "model": "M", "radio": "RTL_S", "freq": "Unknown"},
-                "status": ["OPEN", "CLOSED"],  # string path -> last value
-            },
-            "dev_mean_error": {
-                "__meta__": {"name": "DevE", "model": "M", "radio": "RTL_E", "freq": "433.92M"},
-                "weird": [1.0, "BAD"],  # numeric first elem, but mean() raises -> except -> last value
-                "empty": [],            # empty list -> continue
-            },
-        }
-
-    # Run exactly one iteration then stop: sleep once (process), sleep again (stop)
-    calls = {"n": 0}
-
-    def fake_sleep(_seconds):
-        calls["n"] += 1
-        if calls["n"] >= 2:
-            raise InterruptedError("stop loop")
-
-    monkeypatch.setattr(data_processor.time, "sleep", fake_sleep)
-
-    with pytest.raises(InterruptedError):
-        dp.start_throttle_loop()
+    dp.dispatch_reading("dev_float_int", "temp", 1.0, "DevF", "M", radio_name="RTL_F", radio_freq="915M")
+    dp.dispatch_reading("dev_float_int", "temp", 1.0, "DevF", "M", radio_name="RTL_F", radio_freq="915M")
+    # mean -> 1.0 -> is_integer -> int(1)
+
+    dp.dispatch_reading("dev_string", "status", "OPEN", "DevS", "M", radio_name="RTL_S", radio_freq="Unknown")
+    dp.dispatch_reading("dev_string", "status", "CLOSED", "DevS", "M", radio_name="RTL_S", radio_freq="Unknown")
+    # string path -> last value
+
+    dp.dispatch_reading("dev_mean_error", "weird", 1.0, "DevE", "M", radio_name="RTL_E", radio_freq="433.92M")
+    dp.dispatch_reading("dev_mean_error", "weird", "BAD", "DevE", "M", radio_name="RTL_E", radio_freq="433.92M")
+    # numeric first sample, then a string -> not averageable -> last value
+
+    dp.flush_once()
 
     # Verify sends happened
     assert mqtt.calls, "Expected send_sensor calls from flush"
@@ -147,19 +138,7 @@ def test_start_throttle_loop_empty_buffer_continues(monkeypatch):
     mqtt = DummyMQTT()
     dp = data_processor.DataProcessor(mqtt)
 
-    calls = {"n": 0}
-
-    def fake_sleep(_seconds):
-        calls["n"] += 1
-        # first pass: empty buffer -> continue
-        # second sleep: stop
-        if calls["n"] >= 2:
-            raise InterruptedError("stop loop")
-
-    monkeypatch.setattr(data_processor.time, "sleep", fake_sleep)
-
-    with pytest.raises(InterruptedError):
-        dp.start_throttle_loop()
+    dp.flush_once()
 
     assert mqtt.calls == []
 
@@ -172,24 +151,51 @@ def test_throttle_battery_ok_uses_last_value_not_mean(monkeypatch):
     dp = data_processor.DataProcessor(mqtt)
 
     # Seed buffer with multiple battery_ok values that would differ from the mean.
-    with dp.lock:
-        dp.buffer = {
-            "dev_batt": {
-                "__meta__": {"name": "Dev", "model": "Model", "radio": "RTL", "freq": "433.92M"},
-                "battery_ok": [1, 0, 1],  # mean=0.67, last=1
-            }
-        }
+    for v in (1, 0, 1):  # mean=0.67, last=1
+        dp.dispatch_reading("dev_batt", "battery_ok", v, "Dev", "Model", radio_name="RTL", radio_freq="433.92M")
 
-    calls = {"n": 0}
+    dp.flush_once()
 
-    def fake_sleep(_seconds):
-        calls["n"] += 1
-        if calls["n"] >= 2:
-            raise InterruptedError("stop loop")
+    assert any(c["clean_id"] == "dev_batt" and c["field"] == "battery_ok" and c["value"] == 1 for c in mqtt.calls)
 
-    monkeypatch.setattr(data_processor.time, "sleep", fake_sleep)
 
-    with pytest.raises(InterruptedError):
-        dp.start_throttle_loop()
+def test_dispatch_reading_uses_interval_resolved_at_init(monkeypatch):
+    monkeypatch.setattr(config, "RTL_THROTTLE_INTERVAL", 0, raising=False)
+    mqtt = DummyMQTT()
+    dp = data_processor.DataProcessor(mqtt)
 
-    assert any(c["clean_id"] == "dev_batt" and c["field"] == "battery_ok" and c["value"] == 1 for c in mqtt.calls)
+    # Changing config after construction must not affect the hot path.
+    monkeypatch.setattr(config, "RTL_THROTTLE_INTERVAL", 30, raising=False)
+    dp.dispatch_reading("abc", "temp", 1.5, "Dev", "Model", radio_name="R", radio_freq="915M")
+
+    assert dp.buffer == {}
+    assert [(c["clean_id"], c["field"], c["value"]) for c in mqtt.calls] == [("abc", "temp", 1.5)]
+
+
+def test_start_throttle_loop_uses_interval_resolved_at_init(monkeypatch):
+    monkeypatch.setattr(config, "RTL_THROTTLE_INTERVAL", 0, raising=False)
+    dp = data_processor.DataProcessor(DummyMQTT())
+
+    # Loop must agree with dispatch_reading (which sends immediately) and return.
+    monkeypatch.setattr(config, "RTL_THROTTLE_INTERVAL", 30, raising=False)
+    assert dp.start_throttle_loop() is None
+
+
+def test_flush_swaps_meta_with_buffer(monkeypatch):
+    monkeypatch.setattr(config, "RTL_THROTTLE_INTERVAL", 10, raising=False)
+    mqtt = DummyMQTT()
+    dp = data_processor.DataProcessor(mqtt)
+
+    dp.dispatch_reading("tpms1", "pressure_kPa", 220, "TPMS tpms1", "M1", radio_name="R", radio_freq="315M")
+
+    dp.flush_once()
+
+    # Devices that stop transmitting must not linger in memory after a flush.
+    assert dp.meta == {}
+    assert dp.buffer == {}
+    assert mqtt.calls[0]["dev_name"] == "TPMS tpms1"
+
+    # Name/model are refreshed per interval rather than frozen at first sight.
+    dp.dispatch_reading("tpms1", "pressure_kPa", 221, "Renamed", "M2", radio_name="R", radio_freq="315M")
+    assert dp.meta["tpms1"]["name"] == "Renamed"
+    assert dp.meta["tpms1"]["model"] == "M2"
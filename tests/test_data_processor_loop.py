@@ -16,15 +16,13 @@ def test_throttle_loop_flushes_numeric_and_string(mocker):
     p.dispatch_reading("dev1", "state", "Open", "Dev", "Model", radio_name="RTL0", radio_freq="433M")
     p.dispatch_reading("dev1", "state", "Closed", "Dev", "Model", radio_name="RTL0", radio_freq="433M")
 
-    # sleep once (process), then raise to stop loop
-    mocker.patch.object(data_processor.time, "sleep", side_effect=[None, KeyboardInterrupt])
-
-    with pytest.raises(KeyboardInterrupt):
-        p.start_throttle_loop()
+    p.flush_once()
 
     # mean(10,20,30)=20.0 -> becomes int(20) per code
-    mqtt.send_sensor.assert_any_call("dev1", "temp", 20, "Dev", "Model", is_rtl=True)
-    mqtt.send_sensor.assert_any_call("dev1", "state", "Closed", "Dev", "Model", is_rtl=True)
+    # One publish call per device carrying every flushed field
+    mqtt.send_sensor_bulk.assert_called_once_with(
+        "dev1", {"temp": 20, "state": "Closed"}, "Dev", "Model", is_rtl=True
+    )
 
 
 def test_throttle_loop_no_buffer_sends_nothing(mocker):
@@ -33,10 +31,39 @@ def test_throttle_loop_no_buffer_sends_nothing(mocker):
     mqtt = mocker.Mock()
     p = DataProcessor(mqtt)
 
-    # buffer is empty; loop will continue, so stop it on 2nd sleep
-    mocker.patch.object(data_processor.time, "sleep", side_effect=[None, KeyboardInterrupt])
+    # buffer is empty; nothing to publish
+    assert p.flush_once() == (0, {})
+
+    mqtt.send_sensor_bulk.assert_not_called()
+
+
+def test_stop_ends_throttle_loop(mocker):
+    import threading
+
+    mocker.patch("config.RTL_THROTTLE_INTERVAL", 60)
+
+    mqtt = mocker.Mock()
+    p = DataProcessor(mqtt)
+
+    t = threading.Thread(target=p.start_throttle_loop, daemon=True)
+    t.start()
+    p.stop()
+    t.join(timeout=2)
+
+    # Event.wait() wakes immediately; no need to sit out the 60s interval.
+    assert not t.is_alive()
+    mqtt.send_sensor_bulk.assert_not_called()
+
+
+def test_throttle_loop_flushes_on_each_wakeup_until_stopped(mocker):
+    mocker.patch("config.RTL_THROTTLE_INTERVAL", 1)
+
+    mqtt = mocker.Mock()
+    p = DataProcessor(mqtt)
+    p.dispatch_reading("dev1", "temp", 10.0, "Dev", "Model", radio_name="RTL0", radio_freq="433M")
 
-    with pytest.raises(KeyboardInterrupt):
-        p.start_throttle_loop()
+    # First wait times out (flush), second reports stop() was called.
+    mocker.patch.object(p._stop, "wait", side_effect=[False, True])
+    p.start_throttle_loop()
 
-    mqtt.send_sensor.assert_not_called()
+    mqtt.send_sensor_bulk.assert_called_once_with("dev1", {"temp": 10}, "Dev", "Model", is_rtl=True)
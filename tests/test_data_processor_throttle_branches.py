@@ -10,6 +10,11 @@ class DummyMQTT:
     def __init__(self):
         self.calls = []
 
+    def send_sensor_bulk(self, clean_id, fields, dev_name, model, is_rtl=True):
+        # Throttled flushes publish all fields of a device in one call.
+        for field, value in fields.items():
+            self.send_sensor(clean_id, field, value, dev_name, model, is_rtl=is_rtl)
+
     def send_sensor(self, clean_id, field, value, dev_name, model, is_rtl=True):
         self.calls.append((clean_id, field, value, dev_name, model, is_rtl))
 
@@ -49,18 +54,7 @@ def test_throttle_loop_flushes_and_formats_values(monkeypatch, capsys):
     dp.dispatch_reading("dev1", "battery_ok", 0, "Device 1", "ModelX", radio_name="RTL_A", radio_freq="915M")
     # NON_AVERAGED_NUMERIC_FIELDS -> last value (0)
 
-    calls = {"n": 0}
-
-    def fake_sleep(_):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            return
-        raise StopIteration
-
-    monkeypatch.setattr(data_processor.time, "sleep", fake_sleep)
-
-    with pytest.raises(StopIteration):
-        dp.start_throttle_loop()
+    dp.flush_once()
 
     # Verify sent values
     sent = {(cid, field): value for (cid, field, value, *_rest) in mqtt.calls}
@@ -71,3 +65,19 @@ def test_throttle_loop_flushes_and_formats_values(monkeypatch, capsys):
     out = capsys.readouterr().out
     assert "Flushed" in out
     assert "RTL_A[915M]" in out
+
+
+def test_throttle_loop_does_not_average_bools(monkeypatch):
+    monkeypatch.setattr(config, "RTL_THROTTLE_INTERVAL", 1, raising=False)
+
+    mqtt = DummyMQTT()
+    dp = data_processor.DataProcessor(mqtt)
+
+    dp.dispatch_reading("dev1", "alarm", True, "Device 1", "ModelX", radio_name="RTL_A", radio_freq="915M")
+    dp.dispatch_reading("dev1", "alarm", False, "Device 1", "ModelX", radio_name="RTL_A", radio_freq="915M")
+    dp.dispatch_reading("dev1", "alarm", False, "Device 1", "ModelX", radio_name="RTL_A", radio_freq="915M")
+
+    dp.flush_once()
+
+    # bool is an int subclass, but flags publish the last sample (not 0.33).
+    assert mqtt.calls == [("dev1", "alarm", False, "Device 1", "ModelX", True)]
@@ -6,3 +6,12 @@ def test_get_field_meta_model_present_but_field_missing_falls_back_to_base_meta(
     # Model matches known prefix, but the field is not present in that model mapping.
     # Should fall through to base_meta.
     assert get_field_meta("unknown_field", device_model="Neptune-R900", base_meta=base) == ("u", "dc", "mdi:test", "Unknown")
+
+
+def test_get_field_meta_model_override_is_case_and_whitespace_insensitive():
+    assert get_field_meta("meter_reading", device_model="  NEPTUNE-R900 ") == (
+        "gal",
+        "water",
+        "mdi:water-pump",
+        "Water Usage",
+    )
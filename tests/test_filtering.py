@@ -20,4 +20,17 @@ def test_blacklist_logic(mocker):
 
     # 3. Test Cases that should be ALLOWED (False)
     assert is_blocked_device("98765", "Generic", "weather") is False
-    assert is_blocked_device("55555", "Nest", "co2") is False
\ No newline at end of file
+    assert is_blocked_device("55555", "Nest", "co2") is False
+
+def test_blacklist_recompiles_when_patterns_change(mocker):
+    mocker.patch("config.DEVICE_BLACKLIST", ["Alpha*"])
+    assert is_blocked_device("1", "AlphaSensor", "x") is True
+
+    mocker.patch("config.DEVICE_BLACKLIST", ["Beta*"])
+    assert is_blocked_device("1", "AlphaSensor", "x") is False
+    assert is_blocked_device("1", "BetaSensor", "x") is True
+
+
+def test_empty_blacklist_blocks_nothing(mocker):
+    mocker.patch("config.DEVICE_BLACKLIST", [])
+    assert is_blocked_device("anything", "Any", "any") is False
@@ -21,8 +21,9 @@ class ImmediateThread:
 
 def _run_main_and_exit_fast(mocker, main_module, max_sleep_calls=6):
     """
-    main.main() sleeps during startup + forever-loop.
-    Patch main.time.sleep to raise KeyboardInterrupt after N calls so tests exit.
+    main.main() sleeps during startup, then blocks in _wait_for_shutdown().
+    Patch main.time.sleep to raise KeyboardInterrupt after N calls, and make the
+    shutdown wait behave like Ctrl+C, so tests exit.
     """
     calls = {"n": 0}
 
@@ -32,6 +33,7 @@ def _run_main_and_exit_fast(mocker, main_module, max_sleep_calls=6):
             raise KeyboardInterrupt()
 
     mocker.patch.object(main_module.time, "sleep", side_effect=fake_sleep)
+    mocker.patch.object(main_module, "_wait_for_shutdown", side_effect=KeyboardInterrupt)
 
 
 def test_main_sets_slot_for_missing_ids_in_manual_mode(mocker):
@@ -64,6 +66,7 @@ def test_main_sets_slot_for_missing_ids_in_manual_mode(mocker):
     class DummyProcessor:
         def __init__(self, mqtt): self.mqtt = mqtt
         def start_throttle_loop(self): return
+        def stop(self): return
 
     mocker.patch.object(main, "HomeNodeMQTT", DummyMQTT)
     mocker.patch.object(main, "DataProcessor", DummyProcessor)
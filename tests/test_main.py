@@ -50,7 +50,7 @@ def test_get_version_appends_build_metadata(mocker, monkeypatch):
 def test_check_dependencies_missing_rtl_433_exits(mocker):
     main = import_main_safely()
 
-    mocker.patch("subprocess.run", return_value=mocker.Mock(stdout=b""))
+    mocker.patch("shutil.which", return_value=None)
     # paho spec doesn't matter if rtl_433 missing first
     mocker.patch("importlib.util.find_spec", return_value=object())
 
@@ -61,7 +61,7 @@ def test_check_dependencies_missing_rtl_433_exits(mocker):
 def test_check_dependencies_missing_paho_exits(mocker):
     main = import_main_safely()
 
-    mocker.patch("subprocess.run", return_value=mocker.Mock(stdout=b"/usr/bin/rtl_433\n"))
+    mocker.patch("shutil.which", return_value="/usr/bin/rtl_433")
     mocker.patch("importlib.util.find_spec", return_value=None)
 
     with pytest.raises(SystemExit):
@@ -70,7 +70,7 @@ def test_check_dependencies_missing_paho_exits(mocker):
 
 def test_main_smoke_run_exits_cleanly(mocker):
     # OPTIONAL but makes this test not require rtl_433 installed:
-    mocker.patch("subprocess.run", return_value=mocker.Mock(stdout=b"/usr/bin/rtl_433\n"))
+    mocker.patch("shutil.which", return_value="/usr/bin/rtl_433")
     mocker.patch("importlib.util.find_spec", return_value=object())
 
     main = import_main_safely()
@@ -88,6 +88,7 @@ def test_main_smoke_run_exits_cleanly(mocker):
     class DummyProcessor:
         def __init__(self, mqtt): self.mqtt = mqtt
         def start_throttle_loop(self): return
+        def stop(self): return
 
     class DummyThread:
         def __init__(self, target=None, args=(), daemon=None):
@@ -111,7 +112,7 @@ def test_main_smoke_run_exits_cleanly(mocker):
     mocker.patch.object(main.config, "RTL_DEFAULT_RATE", "250k")
     mocker.patch.object(main.config, "BRIDGE_NAME", "Bridge")
 
-    # Break the infinite loop in main
+    # Exit main at its shutdown wait (or a startup sleep, whichever comes first)
     calls = {"n": 0}
     def fake_sleep(_):
         calls["n"] += 1
@@ -119,7 +120,20 @@ def test_main_smoke_run_exits_cleanly(mocker):
             raise KeyboardInterrupt()
 
     mocker.patch.object(main.time, "sleep", side_effect=fake_sleep)
+    mocker.patch.object(main, "_wait_for_shutdown", side_effect=KeyboardInterrupt)
     mocker.patch.object(main.threading, "Thread", DummyThread)
 
     main.main()
 
+
+
+def test_wait_for_shutdown_returns_once_shutdown_is_requested(monkeypatch):
+    import threading
+
+    main = import_main_safely()
+
+    ev = threading.Event()
+    ev.set()  # what the SIGTERM handler does
+    monkeypatch.setattr(main, "_SHUTDOWN", ev)
+
+    main._wait_for_shutdown()  # must not block
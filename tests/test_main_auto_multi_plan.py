@@ -42,6 +42,9 @@ class DummyProcessor:
     def start_throttle_loop(self):
         return None
 
+    def stop(self):
+        return None
+
 
 def _setup_main_for_test(monkeypatch, detected_devices, country_code):
     FakeThread.created.clear()
@@ -81,13 +84,15 @@ def _setup_main_for_test(monkeypatch, detected_devices, country_code):
     monkeypatch.setattr(main_mod.config, "RTL_AUTO_HOPPER_HOP_INTERVAL", 20)
     monkeypatch.setattr(main_mod.config, "RTL_AUTO_HOPPER_RATE", "1024k")
 
-    # Exit the infinite loop quickly (it sleeps(1) in the main loop)
+    # Skip startup sleeps; exit main's shutdown wait as if Ctrl+C was pressed.
     def fake_sleep(seconds):
-        if seconds == 1:
-            raise KeyboardInterrupt()
         return None
 
+    def fake_wait_for_shutdown():
+        raise KeyboardInterrupt()
+
     monkeypatch.setattr(main_mod.time, "sleep", fake_sleep)
+    monkeypatch.setattr(main_mod, "_wait_for_shutdown", fake_wait_for_shutdown)
 
 
 
@@ -104,7 +109,7 @@ def test_auto_multi_three_radios_us_hopper_no_overlap(monkeypatch):
 
     _setup_main_for_test(monkeypatch, detected_devices=detected, country_code="US")
 
-    # Run main() until our fake_sleep triggers KeyboardInterrupt.
+    # Run main() until the patched shutdown wait raises KeyboardInterrupt.
     main_mod.main()
 
     threads = _rtl_threads()
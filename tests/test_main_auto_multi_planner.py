@@ -25,6 +25,9 @@ class DummyProcessor:
         # no-op for tests
         return
 
+    def stop(self):
+        return None
+
 
 class FakeThread:
     """
@@ -81,14 +84,13 @@ def run_main(
     monkeypatch.setattr(main, "get_version", lambda: "vtest")
     monkeypatch.setattr(main, "show_logo", lambda *_: None)
 
-    # Sleep: ignore startup sleeps, but exit loop quickly
-    sleep_calls = {"n": 0}
+    # Sleep: ignore startup sleeps; exit main's shutdown wait as if Ctrl+C was pressed.
     def fake_sleep(seconds):
-        # Allow the startup sleeps to be skipped; exit the main loop on the first 1s sleep.
-        if seconds == 1:
-            raise KeyboardInterrupt()
         return None
+    def fake_wait_for_shutdown():
+        raise KeyboardInterrupt()
     monkeypatch.setattr(main.time, "sleep", fake_sleep)
+    monkeypatch.setattr(main, "_wait_for_shutdown", fake_wait_for_shutdown)
 
     # Replace threading
     monkeypatch.setattr(main.threading, "Thread", FakeThread)
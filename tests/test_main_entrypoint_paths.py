@@ -57,16 +57,21 @@ class DummyProcessor:
     def start_throttle_loop(self):
         return None
 
+    def stop(self):
+        return None
+
 
 def _patch_sleep_to_exit(monkeypatch, main_mod):
-    """Exit main's infinite loop by raising KeyboardInterrupt on the 1s sleep."""
+    """Skip startup sleeps and exit main's shutdown wait as if Ctrl+C was pressed."""
 
     def fake_sleep(secs):
-        if secs == 1:
-            raise KeyboardInterrupt()
         return None
 
+    def fake_wait_for_shutdown():
+        raise KeyboardInterrupt()
+
     monkeypatch.setattr(main_mod.time, "sleep", fake_sleep)
+    monkeypatch.setattr(main_mod, "_wait_for_shutdown", fake_wait_for_shutdown)
 
 
 @pytest.fixture
@@ -20,16 +20,7 @@ def test_main_timestamped_print_formats_startup_and_debug(monkeypatch):
     captured = []
 
     # Make timestamp deterministic
-    class FakeNow:
-        def strftime(self, _fmt):
-            return "12:34:56"
-
-    class FakeDateTime:
-        @staticmethod
-        def now():
-            return FakeNow()
-
-    monkeypatch.setattr(main, "datetime", FakeDateTime)
+    monkeypatch.setattr(main.time, "strftime", lambda _fmt, *a: "12:34:56")
 
     # Capture what timestamped_print emits
     def fake_original_print(msg, *a, **k):
@@ -68,3 +59,32 @@ def test_main_show_logo_writes_to_stdout(capsys):
     out = capsys.readouterr().out
     assert "RTL-SDR Bridge for Home Assistant" in out
     assert "v9.9.9" in out
+
+
+def test_main_highlight_support_tags_normalizes_variants():
+    import main
+
+    out = main.highlight_support_tags("[ !! UNSUPPORTED !! ] a / [ SUPPORTED ] b")
+    assert out.count(main.c_yellow + "UNSUPPORTED") == 1
+    assert out.count(main.c_green + "SUPPORTED") == 1
+    assert "!!" not in out
+
+
+def test_main_get_source_color_memoizes_by_tag(monkeypatch):
+    import main
+
+    monkeypatch.setattr(main, "_SOURCE_COLOR_CACHE", {})
+    assert main.get_source_color("RTL_101") == main.c_magenta
+    assert main._SOURCE_COLOR_CACHE == {"RTL_101": main.c_magenta}
+
+    monkeypatch.setattr(main, "_SOURCE_COLOR_CACHE_MAX", 1)
+    assert main.get_source_color("other") == main.c_cyan
+    assert "other" not in main._SOURCE_COLOR_CACHE
+
+
+def test_main_highlight_json_colors_bare_values_in_one_pass():
+    import main
+
+    w, r = main.c_white, main.c_reset
+    out = main.highlight_json('a: 5 b:"q" c: false')
+    assert out == f'a: {w}5{r} b: {w}"q"{r} c: {w}false{r}'
@@ -34,12 +34,7 @@ def test_timestamped_print_error_warning_and_tx_branches(monkeypatch):
     monkeypatch.setattr(m, "_original_print", cap)
 
     # Freeze time
-    class FakeDT:
-        @staticmethod
-        def now():
-            return types.SimpleNamespace(strftime=lambda fmt: "00:00:00")
-
-    monkeypatch.setattr(m, "datetime", FakeDT)
+    monkeypatch.setattr(m.time, "strftime", lambda fmt, *a: "00:00:00")
 
     # ERROR path
     m.timestamped_print("ERROR: something bad happened")
@@ -58,9 +53,38 @@ def test_check_dependencies_paho_missing_exits(monkeypatch):
     m = import_main_safely()
 
     # rtl_433 exists
-    monkeypatch.setattr(m.subprocess, "run", lambda *a, **k: types.SimpleNamespace(stdout=b"/usr/bin/rtl_433\n"))
+    monkeypatch.setattr(m.shutil, "which", lambda name: "/usr/bin/rtl_433")
     # paho missing
     monkeypatch.setattr(m.importlib.util, "find_spec", lambda name: None)
 
     with pytest.raises(SystemExit):
         m.check_dependencies()
+
+
+def test_timestamped_print_source_header_strips_rx_prefix(monkeypatch):
+    m = import_main_safely()
+
+    captured = []
+    monkeypatch.setattr(m, "_original_print", lambda *a, **k: captured.append(a[0] if a else ""))
+
+    m.timestamped_print("[RTL_101] RX: hello")
+    m.timestamped_print("[MQTT]: connected")
+    m.timestamped_print("[unterminated hello")
+
+    tag_end = f"{m.c_white}]:{m.c_reset} "
+    assert captured[0].endswith(tag_end + "hello")
+    assert captured[1].endswith(tag_end + "connected")
+    assert captured[2].endswith("[unterminated hello")
+
+
+def test_timestamped_print_joins_multiple_args_like_print(monkeypatch):
+    m = import_main_safely()
+
+    captured = []
+    monkeypatch.setattr(m, "_original_print", lambda *a, **k: captured.append(a[0] if a else ""))
+
+    m.timestamped_print("count", 3, None)
+    m.timestamped_print("single")
+
+    assert captured[0].endswith("count 3 None")
+    assert captured[1].endswith("single")
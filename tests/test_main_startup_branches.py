@@ -15,6 +15,7 @@ def test_main_manual_config_duplicate_ids_and_unconfigured_hardware(mocker, caps
     class DummyProcessor:
         def __init__(self, mqtt): self.mqtt = mqtt
         def start_throttle_loop(self): return
+        def stop(self): return
 
     class DummyThread:
         def __init__(self, target=None, args=(), daemon=None):
@@ -63,6 +64,7 @@ def test_main_manual_config_duplicate_ids_and_unconfigured_hardware(mocker, caps
             raise KeyboardInterrupt()
 
     mocker.patch.object(main.time, "sleep", side_effect=fake_sleep)
+    mocker.patch.object(main, "_wait_for_shutdown", side_effect=KeyboardInterrupt)
 
     main.main()
 
@@ -99,6 +101,7 @@ def test_main_auto_mode_warns_when_ignoring_extra_radios(mocker, capsys):
     class DummyProcessor:
         def __init__(self, mqtt): self.mqtt = mqtt
         def start_throttle_loop(self): return
+        def stop(self): return
 
     class DummyThread:
         def __init__(self, target=None, args=(), daemon=None): pass
@@ -134,6 +137,7 @@ def test_main_auto_mode_warns_when_ignoring_extra_radios(mocker, capsys):
             raise KeyboardInterrupt()
 
     mocker.patch.object(main.time, "sleep", side_effect=fake_sleep)
+    mocker.patch.object(main, "_wait_for_shutdown", side_effect=KeyboardInterrupt)
 
     main.main()
     out = capsys.readouterr().out.lower()
@@ -162,6 +166,7 @@ def test_main_deduplicates_hardware_serials(mocker, capsys):
     class DummyProcessor:
         def __init__(self, mqtt): self.mqtt = mqtt
         def start_throttle_loop(self): return
+        def stop(self): return
 
     mocker.patch.object(main, "HomeNodeMQTT", DummyMQTT)
     mocker.patch.object(main, "DataProcessor", DummyProcessor)
@@ -184,12 +189,13 @@ def test_main_deduplicates_hardware_serials(mocker, capsys):
     # 1. Logo
     # 2. Radio 1 Start
     # 3. Radio 2 Start
-    # 4. Main Loop (We want to interrupt HERE)
+    # The idle wait is _wait_for_shutdown() (patched below), not a sleep.
     calls = {"n": 0}
     def fake_sleep(_):
         calls["n"] += 1
         if calls["n"] >= 4: raise KeyboardInterrupt()
     mocker.patch.object(main.time, "sleep", side_effect=fake_sleep)
+    mocker.patch.object(main, "_wait_for_shutdown", side_effect=KeyboardInterrupt)
 
     # --- Run ---
     main.main()
@@ -187,3 +187,17 @@ def test_send_sensor_radio_status_does_not_crash(mocker):
     _call_send_sensor(h, field="radio_status", value="OK", unit=None)
 
     assert any(t.endswith("/config") for (t, _p, _q, _r) in dummy.published)
+
+
+def test_send_sensor_bulk_publishes_each_field_once(monkeypatch):
+    import mqtt_handler as mh
+
+    h = mh.HomeNodeMQTT(version="vtest")
+    sent = []
+    monkeypatch.setattr(h, "_send_field", lambda clean_id, field, value, *a: sent.append((clean_id, field, value)))
+
+    h.send_sensor_bulk("AA:BB", {"temperature": 70.1, "humidity": 40, "skip": None}, "Dev", "Model")
+
+    assert sent == [("aabb", "temperature", 70.1), ("aabb", "humidity", 40)]
+    assert "Dev" in h.tracked_devices
+    assert h._device_model_by_id["aabb"] == "Model"